@@ -2,62 +2,181 @@
 
 # Doc: https://coddingtonbear.github.io/obsidian-local-rest-api/#/
 
+import hashlib
+import importlib.util
 import logging as logging
 import os
+import ssl
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List
+from contextlib import closing
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple
 
-from requests import Request, Session
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 from urllib3 import disable_warnings
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 
-""" Logger set up """
-# Set up a logger to log info to console and all messages to a log file
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
-
-# Get current working directory and create a new folder called log to save log files
-dir_path = os.path.dirname(os.path.realpath(__file__))
-if not os.path.exists(dir_path + "/logs"):
-    os.makedirs(dir_path + "/logs")
-
-logfile = (
-    f'{dir_path}/logs/obsidian_api_{datetime.now().strftime("%H_%M_%d_%m_%Y")}.log'
-)
-
-logging.basicConfig(
-    filename=logfile,
-    level=logging.DEBUG,
-    format="[%(asctime)s]%(levelname)s - %(message)s",
-    datefmt="%H:%M:%S",
-    filemode="w",
-)
-
-# Set up logging to console
-console = logging.StreamHandler()
-console.setLevel(logging.INFO)
-# Set a format which is simpler for console use
-formatter = logging.Formatter("%(name)-12s: %(levelname)-8s %(message)s")
-console.setFormatter(formatter)
-# Add the handler to the root logger
-logging.getLogger("").addHandler(console)
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+except ImportError:  # fall back to the (slower) standard library
+    _json_dumps, _json_loads = json.dumps, json.loads
+
+try:
+    import httpx
 
-disable_warnings(InsecureRequestWarning)
+    # Only error statuses are handled; connection errors and timeouts are
+    # raised to the caller, whichever transport is used.
+    _HTTP_ERRORS = (HTTPError, httpx.HTTPStatusError)
+except ImportError:  # httpx is only needed by AsyncObsidianFiles and HTTP/2
+    httpx = None
+    _HTTP_ERRORS = (HTTPError,)
+
+logger = logging.getLogger(__name__)
+_logging_configured = False
+_insecure_warnings_disabled = False
+
+
+def configure_logging(dir_path: str or None = None, level: int = logging.DEBUG):
+    """Set up a logger to log info to console and all messages to a log file.
+
+    Called automatically the first time a client is created, unless logging
+    was already configured (the root logger has handlers); call it yourself
+    beforehand to log to a different directory or at a different level.
+
+    Args:
+        dir_path (str or None, optional): Directory in which the `logs` folder
+        is created. Defaults to the directory of this module.
+        level (int, optional): Level of the messages written to the log file.
+        Defaults to logging.DEBUG.
+    """
+    global _logging_configured
+    _logging_configured = True
+
+    for handler in logging.root.handlers[:]:
+        logging.root.removeHandler(handler)
+
+    # Create a new folder called logs to save log files
+    if dir_path is None:
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+    if not os.path.exists(dir_path + "/logs"):
+        os.makedirs(dir_path + "/logs")
+
+    logfile = (
+        f'{dir_path}/logs/obsidian_api_{datetime.now().strftime("%H_%M_%d_%m_%Y")}.log'
+    )
+
+    logging.basicConfig(
+        filename=logfile,
+        level=level,
+        format="[%(asctime)s]%(levelname)s - %(message)s",
+        datefmt="%H:%M:%S",
+        filemode="w",
+    )
+
+    # Set up logging to console
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    # Set a format which is simpler for console use
+    formatter = logging.Formatter("%(name)-12s: %(levelname)-8s %(message)s")
+    console.setFormatter(formatter)
+    # Add the handler to the root logger
+    logging.getLogger("").addHandler(console)
+
+
+def _disable_insecure_warnings():
+    """Silence the warnings urllib3 emits for unverified HTTPS requests, once."""
+    global _insecure_warnings_disabled
+    if not _insecure_warnings_disabled:
+        disable_warnings(InsecureRequestWarning)
+        _insecure_warnings_disabled = True
+
+
+def _httpx_verify(cert: Tuple[str, str] or None) -> ssl.SSLContext or bool:
+    """Returns the `verify` argument for an httpx client: an SSL context
+    presenting the client certificate, or False when there is none.
+    """
+    if cert is None:
+        return False
+    context = ssl.create_default_context()
+    context.load_cert_chain(*cert)
+    return context
+
+
+@lru_cache(maxsize=1024)
+def _quote_path(path: str) -> str:
+    """URL-encode a path in the vault, keeping its "/" separators."""
+    return quote(path, safe="/")
 
 
 class ObsidianFiles:
+    __slots__ = (
+        "api_url",
+        "token",
+        "max_workers",
+        "transport",
+        "dedupe_window_seconds",
+        "headers",
+        "cert",
+        "_timeout",
+        "_url_active",
+        "_url_vault",
+        "_url_commands",
+        "_url_search",
+        "_url_open",
+        "_session",
+        "_cache",
+        "_cache_lock",
+        "_recent_appends",
+    )
+
+    # Number of recent appends remembered to skip duplicates
+    _RECENT_APPENDS_SIZE = 256
+    # Number of responses kept for revalidation
+    _CACHE_SIZE = 256
+
     def __init__(
         self,
         api_url: str,
         token: str,
         public_cert: str or None = None,
         public_key: str or None = None,
+        max_workers: int = 16,
+        transport: str = "requests",
+        dedupe_window_seconds: float = 0.0,
+        timeout: float = 10.0,
     ):
+        if transport not in ("requests", "httpx2"):
+            raise ValueError(f"Unknown transport {transport!r}.")
+        if transport == "httpx2" and (
+            httpx is None or importlib.util.find_spec("h2") is None
+        ):
+            raise ImportError(
+                "The httpx2 transport requires httpx with HTTP/2 support, "
+                "install it with `pip install httpx[http2]`."
+            )
+
+        # Leave the application's own logging setup alone
+        if not _logging_configured and not logging.root.handlers:
+            configure_logging()
+
         self.api_url = api_url
         self.token = token
+        self.max_workers = max_workers
+        self.transport = transport
+        self.dedupe_window_seconds = dedupe_window_seconds
+        # Bounds every request so a stuck socket cannot hold a pool slot forever
+        self._timeout = timeout
         self.headers = {
             "accept": "text/markdown",
             "Authorization": f"Bearer {self.token}",
@@ -66,42 +185,227 @@ class ObsidianFiles:
         self.cert = (
             (public_cert, public_key) if public_cert and public_key else None
         )  # certifi.where()
+        # Without a certificate the local server's self-signed one is not verified
+        if self.cert is None:
+            _disable_insecure_warnings()
+
+        # Endpoint URLs are joined once here rather than on every request
+        self._url_active = f"{api_url}/active/"
+        self._url_vault = f"{api_url}/vault/"
+        self._url_commands = f"{api_url}/commands/"
+        self._url_search = f"{api_url}/search/"
+        self._url_open = f"{api_url}/open/"
+
+        # Keep one session alive for the lifetime of the client so that
+        # consecutive calls reuse the same pooled (keep-alive) connection
+        # instead of paying a new TCP/TLS handshake every time.
+        if transport == "httpx2":
+            # HTTP/2 multiplexes concurrent requests over a single connection
+            self._session = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                verify=_httpx_verify(self.cert),
+                limits=httpx.Limits(max_connections=max_workers),
+            )
+        else:
+            self._session = Session()
+            self._session.headers.update(self.headers)
+            # Set once so every pooled connection shares the same SSL settings
+            self._session.cert = self.cert
+            self._session.verify = bool(self.cert)
+            # Transient server errors are retried with exponential backoff on the
+            # pooled connection; once retries run out the last response is
+            # returned so that raise_for_status reports it as usual. POST and
+            # PATCH append/insert content, so they are never replayed.
+            retries = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods={"GET", "PUT", "DELETE"},
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=max_workers, max_retries=retries
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        # Recent responses of cacheable GET requests keyed by (url, accept),
+        # stored as (ETag, Last-Modified, raw body) so that they can be
+        # revalidated with a conditional request instead of being downloaded
+        # again. Guarded by a lock as bulk_get reads from several threads.
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[str, str, Any]]" = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+
+        # When the dedupe window is set, appending the same content to the same
+        # target note again within that many seconds is skipped without a
+        # request. Appends to the active note are never skipped, as the user
+        # may have switched to a different note in between.
+        self._recent_appends: "OrderedDict[Tuple[str, bytes], float]" = OrderedDict()
+
+    def close(self):
+        """Close the underlying session and release its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
 
-    def _send_request(self, method: str, cmd: str, data: str or None = None) -> str:
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        data: str or None = None,
+        headers: Dict[str, str] or None = None,
+        params: Dict[str, Any] or None = None,
+        stream: bool = False,
+    ) -> Response or "httpx.Response":
         """Send an HTTP request to your local Obsidian server
 
         Args:
             method (str): HTTP method to send. Must be one of the following methods:
             - POST, GET, DELETE, PATCH, PUT
-            cmd (str): Endpoint command to send. Must be one of the following endpoints:
-            - active, vault, periodic, commands, search, open
+            url (str): URL of the endpoint to send the request to, built from one of the
+            `_url_*` prefixes: active, vault, commands, search, open
             data (str or None, optional): Content to add to the target file. Defaults to None.
+            headers (Dict[str, str] or None, optional): Per-request headers,
+            merged on top of the session defaults. Defaults to None.
+            params (Dict[str, Any] or None, optional): Query string parameters,
+            url-encoded and appended to the endpoint. Defaults to None.
+            stream (bool, optional): Whether to defer downloading the response body
+            until it is read. Defaults to False.
 
         Returns:
-            str: The content in markdown format.
+            Response or httpx.Response: The response returned by the server,
+            depending on the transport.
         """
-        s = Session()
-        _request = (
-            Request(
-                method,
-                f"{self.api_url}{cmd}",
-                headers=self.headers,
-                data=data,
-            )
-            if data
-            else Request(
+        if self.transport == "httpx2":
+            request = self._session.build_request(
                 method,
-                f"{self.api_url}{cmd}",
-                headers=self.headers,
+                url,
+                content=data,
+                headers=headers,
+                params=params,
+                timeout=self._timeout,
             )
+            return self._session.send(request, stream=stream)
+
+        return self._session.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            data=data,
+            # Passed explicitly: REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE would
+            # otherwise take precedence over the session's verify setting
+            verify=self._session.verify,
+            stream=stream,
+            timeout=self._timeout,
         )
-        prepped = s.prepare_request(_request)
-        resp = (
-            s.send(prepped, cert=self.cert)
-            if self.cert
-            else s.send(prepped, verify=False)
+
+    def _stream_body(self, resp: Response, chunk_size: int) -> Iterator[bytes]:
+        """Check the status of a streamed response and iterate over its raw body.
+
+        The status is checked eagerly, before the iterator is returned, so that
+        errors reach the caller instead of looking like an empty note.
+        """
+        try:
+            resp.raise_for_status()
+        except _HTTP_ERRORS as err:
+            resp.close()
+            logging.error(err)
+            raise
+        return self._iter_chunks(resp, chunk_size)
+
+    def _iter_chunks(self, resp: Response, chunk_size: int) -> Iterator[bytes]:
+        """Iterate over the raw body of a streamed response, then close it."""
+        with closing(resp):
+            if self.transport == "httpx2":
+                yield from resp.iter_bytes(chunk_size)
+            else:
+                yield from resp.iter_content(chunk_size=chunk_size)
+
+    def _conditional_headers(
+        self, cached: Tuple[str, str, Any] or None, headers: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Add the validators of a cached response to the request headers."""
+        if cached is None:
+            return headers
+        etag, last_modified, _ = cached
+        headers = dict(headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _cached_response(self, key: Tuple[str, str]) -> Tuple[str, str, Any] or None:
+        """Returns the cached (ETag, Last-Modified, raw body) of a request, if any."""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def _cache_response(self, key: Tuple[str, str], resp: Response, body: Any):
+        """Remember the raw body of a response if the server sent validators for it,
+        evicting the least recently used one when full.
+        """
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+        with self._cache_lock:
+            self._cache[key] = (etag, last_modified, body)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _invalidate_cache(self, target_filename: str):
+        """Drop the cached content of a file and all cached directory listings."""
+        url = self._url_vault + _quote_path(target_filename)
+        with self._cache_lock:
+            for key in list(self._cache):
+                # Listings may be requested with or without a trailing slash,
+                # so they are recognised by what they accept instead
+                if key[0] == url or key[1] == "application/json":
+                    del self._cache[key]
+
+    def _append_key(self, url: str, content: str) -> Tuple[str, bytes] or None:
+        """Returns the key identifying an append, or None if dedupe is disabled."""
+        if self.dedupe_window_seconds <= 0:
+            return None
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        return url, digest
+
+    def _is_duplicate_append(self, key: Tuple[str, bytes] or None) -> bool:
+        """Whether the same append was already sent within the dedupe window."""
+        appended_at = self._recent_appends.get(key)
+        return (
+            appended_at is not None
+            and time.monotonic() - appended_at < self.dedupe_window_seconds
         )
-        return resp
+
+    def _remember_append(self, key: Tuple[str, bytes] or None):
+        """Record a successful append, evicting the oldest one when full."""
+        if key is None:
+            return
+        self._recent_appends[key] = time.monotonic()
+        self._recent_appends.move_to_end(key)
+        if len(self._recent_appends) > self._RECENT_APPENDS_SIZE:
+            self._recent_appends.popitem(last=False)
+
+    def _forget_appends(self, target_filename: str):
+        """Drop the recent appends to a note that another write just changed,
+        so appending the same content again is not mistaken for a duplicate.
+        """
+        url = self._url_vault + _quote_path(target_filename)
+        for key in [key for key in self._recent_appends if key[0] == url]:
+            del self._recent_appends[key]
 
     ### For Active files request! ###
     def _get_active_file_content(self) -> str:
@@ -110,28 +414,52 @@ class ObsidianFiles:
 
         """
         try:
-            resp = self._send_request("GET", cmd="/active/")
+            resp = self._send_request("GET", self._url_active)
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Success!")
             return resp.text  # in text/markdown format
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
+    def _get_active_file_content_stream(
+        self, chunk_size: int = 65536
+    ) -> Iterator[bytes]:
+        """Returns the content of the currently active (open) file in Obsidian
+        as an iterator of raw bytes chunks, without loading the whole note in memory.
+
+        Note:
+            Unlike the other getters, an error status is raised rather than
+            logged and returned as None, as an empty iterator would look like
+            an empty note. The response is closed once the iterator is
+            exhausted; an iterator that is never iterated keeps its pooled
+            connection checked out until it is garbage collected.
+
+        Args:
+            chunk_size (int): Maximum size in bytes of each chunk. Default: 65536
+
+        Raises:
+            HTTPError: If the server returned an error status, e.g. no file is open
+            (httpx.HTTPStatusError with the httpx2 transport).
+        """
+        resp = self._send_request("GET", self._url_active, stream=True)
+        return self._stream_body(resp, chunk_size)
+
     def _append_content_to_active_file(self, content: str):
         """Appends content to the end of the currently-open note.
 
         Args:
             content (str): the content to append
         """
-        self.headers["accept"] = "*/*"
         try:
-            resp = self._send_request("POST", cmd="/active/", data=content)
+            resp = self._send_request(
+                "POST", self._url_active, data=content, headers={"accept": "*/*"}
+            )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Added content successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -142,22 +470,22 @@ class ObsidianFiles:
             content (str): the content to update (replace) for the current active note
         """
         try:
-            resp = self._send_request("POST", cmd="/active/", data=content)
+            resp = self._send_request("POST", self._url_active, data=content)
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Updated content successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
     def _delete_active_file(self):
         """Delete the currently active file in Obsidian"""
         try:
-            resp = self._send_request("DELETE", cmd="/active/")
+            resp = self._send_request("DELETE", self._url_active)
             resp.raise_for_status()
             if resp.status_code == 204:
                 logger.info("Deleted the currently active file in Obsidian.")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -190,19 +518,23 @@ class ObsidianFiles:
 
         """
         # set the header parameters
-        self.headers["accept"] = "*/*"
-        self.headers["Heading"] = heading
-        self.headers["Content-Insertion-Position"] = insert_position
-        self.headers["Content-Type"] = "text/markdown"
+        headers = {
+            "accept": "*/*",
+            "Heading": heading,
+            "Content-Insertion-Position": insert_position,
+            "Content-Type": "text/markdown",
+        }
         if heading_boundary != "":
-            self.headers["Heading-Boundary"] = heading_boundary
+            headers["Heading-Boundary"] = heading_boundary
 
         try:
-            resp = self._send_request("PATCH", cmd="/active/", data=content)
+            resp = self._send_request(
+                "PATCH", self._url_active, data=content, headers=headers
+            )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Inserted the content successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -222,21 +554,71 @@ class ObsidianFiles:
             Default is 'text/markdown,
             can be set to 'json' to get frontmatter, tags, and stats.
         """
-        if return_format == "json":
-            self.headers["accept"] = "application/vnd.olrapi.note+json"
+        accept = (
+            "application/vnd.olrapi.note+json"
+            if return_format == "json"
+            else "text/markdown"
+        )
+        url = self._url_vault + _quote_path(target_filename)
+        cached = self._cached_response((url, accept))
 
         try:
-            resp = self._send_request("POST", cmd=f"/vault/{target_filename}")
+            resp = self._send_request(
+                "GET",
+                url,
+                headers=self._conditional_headers(cached, {"accept": accept}),
+            )
+            # Markdown is cached as an (immutable) str, JSON as its raw bytes
+            # which are parsed again so callers never share a cached object
+            if resp.status_code == 304:
+                if cached is None:
+                    logging.error(f"Got 304 for {target_filename} without a cache.")
+                    return None
+                logger.info(f"{target_filename} is unchanged, using cached content.")
+                body = cached[2]
+                return body if return_format == "text/markdown" else _json_loads(body)
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info(f"Got the content of {target_filename} successfully!")
-                return resp.text if return_format == "text/markdown" else resp.json()
-        except HTTPError as err:
+                body = resp.text if return_format == "text/markdown" else resp.content
+                self._cache_response((url, accept), resp, body)
+                return body if return_format == "text/markdown" else _json_loads(body)
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
         return resp.json() if return_format == "json" else resp
 
+    def _get_target_file_content_stream(
+        self, target_filename: str, chunk_size: int = 65536
+    ) -> Iterator[bytes]:
+        """Returns the content of the file at the specified path in your vault
+        as an iterator of raw markdown bytes chunks, without loading the whole
+        note in memory.
+
+        Useful to copy large notes to disk; for small notes prefer
+        `_get_target_file_content`.
+
+        Note:
+            Unlike the other getters, an error status is raised rather than
+            logged and returned as None, as an empty iterator would look like
+            an empty note. The response is closed once the iterator is
+            exhausted; an iterator that is never iterated keeps its pooled
+            connection checked out until it is garbage collected.
+
+        Args:
+            target_filename (str): path to the file to return (relative to your vault root).
+            chunk_size (int): Maximum size in bytes of each chunk. Default: 65536
+
+        Raises:
+            HTTPError: If the server returned an error status, e.g. the file does
+            not exist (httpx.HTTPStatusError with the httpx2 transport).
+        """
+        resp = self._send_request(
+            "GET", self._url_vault + _quote_path(target_filename), stream=True
+        )
+        return self._stream_body(resp, chunk_size)
+
     def _create_or_update_file(self, target_filename: str, content: str):
         """Create a new file in your vault or
         update the content of an existing one if the specified file already exists.
@@ -245,15 +627,19 @@ class ObsidianFiles:
             target_filename (str): path to the file to return (relative to your vault root).
             content (str): the content to insert.
         """
-        self.headers["accept"] = "*/*"
+        self._invalidate_cache(target_filename)
+        self._forget_appends(target_filename)
         try:
             resp = self._send_request(
-                "PUT", cmd=f"/vault/{target_filename}", data=content
+                "PUT",
+                self._url_vault + _quote_path(target_filename),
+                data=content,
+                headers={"accept": "*/*"},
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info(f"Updated {target_filename} successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -265,11 +651,11 @@ class ObsidianFiles:
 
         """
         try:
-            resp = self._send_request("DELETE", cmd="/active/")
+            resp = self._send_request("DELETE", self._url_active)
             resp.raise_for_status()
             if resp.status_code == 204:
                 logger.info(f"Deleted {target_filename} in Obsidian.")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -278,15 +664,24 @@ class ObsidianFiles:
         Appends content to the end of the target note.
         If the specified file does not yet exist, it will be created as an empty file.
         """
-        self.headers["accept"] = "*/*"
+        key = self._append_key(self._url_vault + _quote_path(target_filename), content)
+        if self._is_duplicate_append(key):
+            logger.info(f"Skipped appending content just added to {target_filename}.")
+            return None
+
+        self._invalidate_cache(target_filename)
         try:
             resp = self._send_request(
-                "PUT", cmd=f"/vault/{target_filename}", data=content
+                "PUT",
+                self._url_vault + _quote_path(target_filename),
+                data=content,
+                headers={"accept": "*/*"},
             )
             resp.raise_for_status()
+            self._remember_append(key)
             if resp.status_code == 200:
                 logger.info(f"Updated {target_filename} successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -322,21 +717,28 @@ class ObsidianFiles:
 
         """
         # set the header parameters
-        self.headers["accept"] = "*/*"
-        self.headers["Heading"] = heading
-        self.headers["Content-Insertion-Position"] = insert_position
-        self.headers["Content-Type"] = "text/markdown"
+        headers = {
+            "accept": "*/*",
+            "Heading": heading,
+            "Content-Insertion-Position": insert_position,
+            "Content-Type": "text/markdown",
+        }
         if heading_boundary != "":
-            self.headers["Heading-Boundary"] = heading_boundary
+            headers["Heading-Boundary"] = heading_boundary
 
+        self._invalidate_cache(target_filename)
+        self._forget_appends(target_filename)
         try:
             resp = self._send_request(
-                "PATCH", cmd=f"/vault/{target_filename}", data=content
+                "PATCH",
+                self._url_vault + _quote_path(target_filename),
+                data=content,
+                headers=headers,
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info(f"Inserted content to {target_filename} successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -347,13 +749,18 @@ class ObsidianFiles:
             target_filename (str): The target file to delete from the vault.
 
         """
-        self.headers["accept"] = "*/*"
+        self._invalidate_cache(target_filename)
+        self._forget_appends(target_filename)
         try:
-            resp = self._send_request("DELETE", cmd=f"/vault/{target_filename}")
+            resp = self._send_request(
+                "DELETE",
+                self._url_vault + _quote_path(target_filename),
+                headers={"accept": "*/*"},
+            )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info(f"Deleted {target_filename} successfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -371,17 +778,28 @@ class ObsidianFiles:
             Dict[str, any]: All the files in the target directory in JSON format.
 
         """
+        url = self._url_vault + _quote_path(target_dir)
+        cached = self._cached_response((url, "application/json"))
         try:
-            self.headers["accept"] = "application/json"
             resp = self._send_request(
                 "GET",
-                cmd=f"/vault/{target_dir}",
+                url,
+                headers=self._conditional_headers(
+                    cached, {"accept": "application/json"}
+                ),
             )
+            if resp.status_code == 304:
+                if cached is None:
+                    logging.error(f"Got 304 for {target_dir} without a cached listing.")
+                    return None
+                logger.info(f"{target_dir} is unchanged, using the cached listing.")
+                return _json_loads(cached[2])
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info(f"Got the list of files in {target_dir} successfully!")
-                return resp.json()
-        except HTTPError as err:
+                self._cache_response((url, "application/json"), resp, resp.content)
+                return _json_loads(resp.content)
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -394,16 +812,16 @@ class ObsidianFiles:
 
         """
         try:
-            self.headers["accept"] = "application/json"
             resp = self._send_request(
                 "GET",
-                cmd="/commands/",
+                self._url_commands,
+                headers={"accept": "application/json"},
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Fetched all the commands successfully!")
-                return resp.json()
-        except HTTPError as err:
+                return _json_loads(resp.content)
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -419,15 +837,15 @@ class ObsidianFiles:
 
         """
         try:
-            self.headers["accept"] = "*/*"
             resp = self._send_request(
                 "POST",
-                cmd=f"/commands/{command_id}",
+                self._url_commands + _quote_path(command_id),
+                headers={"accept": "*/*"},
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("The command is executed sucessfully!")
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -483,28 +901,73 @@ class ObsidianFiles:
 
         """
         try:
-            self.headers["accept"] = "application/json"
-            self.headers["Content-Type"] = (
-                "application/vnd.olrapi.dataview.dql+txt"
-                if isinstance(request_body, str)
-                else "application/vnd.olrapi.jsonlogic+json"
-            )
+            headers = {
+                "accept": "application/json",
+                "Content-Type": (
+                    "application/vnd.olrapi.dataview.dql+txt"
+                    if isinstance(request_body, str)
+                    else "application/vnd.olrapi.jsonlogic+json"
+                ),
+            }
 
             req_body = (
                 request_body
                 if isinstance(request_body, str)
-                else json.dumps(request_body)
+                else _json_dumps(request_body)
             )
 
-            resp = self._send_request("POST", cmd="/search/", data=req_body)
+            resp = self._send_request(
+                "POST", self._url_search, data=req_body, headers=headers
+            )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Got the results!")
-                return resp.json()
-        except HTTPError as err:
+                return _json_loads(resp.content)
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
+    def search_many(self, queries: List[str or dict]) -> Dict[str, List[str]]:
+        """Run several JsonLogic searches against your vault in a single request.
+
+        Rather than sending one search per query, every query is evaluated
+        by the server in one pass over the vault. Files matching any of the
+        queries are returned together with the value of each individual
+        query, which is used to group the matches back per query.
+
+        Args:
+            queries (List[str or dict]): The queries to run. A string is treated
+            as a glob pattern matched against the path of each file,
+            e.g. "daily/*.md"; a dict is used as-is as a JsonLogic query.
+
+        Returns:
+            Dict[str, List[str]]: The filenames matching each query, keyed by
+            the query (dict queries are keyed by their JSON serialisation).
+        """
+        logic = [
+            {"glob": [query, {"var": "path"}]} if isinstance(query, str) else query
+            for query in queries
+        ]
+        # Only files matching at least one query are returned, and their result
+        # holds the value of every query so that the matches can be split up
+        # again without re-evaluating the queries on our side.
+        results = self._search_with_query({"if": [{"or": logic}, logic, False]})
+        if results is None:
+            return None
+
+        # Position of each distinct query in the results; the server returns
+        # every file at most once, so a repeated query cannot list it twice.
+        positions = {
+            query if isinstance(query, str) else json.dumps(query): i
+            for i, query in enumerate(queries)
+        }
+        matches = {key: [] for key in positions}
+        for match in results:
+            for key, i in positions.items():
+                if match["result"][i]:
+                    matches[key].append(match["filename"])
+        return matches
+
     def _search_with_simple_query(
         self, query: str, content_length: int = 100
     ) -> List[dict[str, any]]:
@@ -520,17 +983,17 @@ class ObsidianFiles:
 
         """
         try:
-            self.headers["accept"] = "application/json"
-
             resp = self._send_request(
                 "POST",
-                cmd=f"/search/{query}&contextLength={content_length}",
+                self._url_search + "simple/",
+                headers={"accept": "application/json"},
+                params={"query": query, "contextLength": content_length},
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Got the results!")
                 return resp.json()
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -564,17 +1027,17 @@ class ObsidianFiles:
 
         """
         try:
-            self.headers["accept"] = "application/json"
-
             resp = self._send_request(
                 "POST",
-                cmd=f"/search/gui/?{query}&contextLength={content_length}",
+                self._url_search + "gui/",
+                headers={"accept": "application/json"},
+                params={"query": query, "contextLength": content_length},
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info("Got the results!")
                 return resp.json()
-        except HTTPError as err:
+        except _HTTP_ERRORS as err:
             logging.error(err)
             return None
 
@@ -599,15 +1062,552 @@ class ObsidianFiles:
 
         """
         try:
-            self.headers["accept"] = "application/json"
-
             resp = self._send_request(
                 "POST",
-                cmd=f"/open/{target_filename}?newLeaf={new_leaf}",
+                self._url_open + _quote_path(target_filename),
+                headers={"accept": "application/json"},
+                params={"newLeaf": "true" if new_leaf else "false"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Opened {target_filename} in Obsidian.")
+        except _HTTP_ERRORS as err:
+            logging.error(err)
+            return None
+
+    ### Bulk operations ###
+    def _bulk_workers(self, max_workers: int or None) -> int:
+        """Number of threads for a bulk call, never more than the pool can hold."""
+        return min(max_workers or self.max_workers, self.max_workers)
+
+    def bulk_get(
+        self,
+        filenames: List[str],
+        return_format: str = "text/markdown",
+        max_workers: int or None = None,
+    ) -> Dict[str, Any]:
+        """Fetch the content of several files in your vault concurrently.
+
+        The requests are fanned out over a thread pool sharing the client's
+        pooled session, so the total wall time is close to that of the
+        slowest single request rather than the sum of all of them.
+
+        Args:
+            filenames (List[str]): Paths to the files to return
+            (relative to your vault root).
+            return_format (str): Returned format of the content.
+            See `_get_target_file_content`. Default is 'text/markdown'.
+            max_workers (int or None): Number of concurrent requests, capped at
+            the `max_workers` the client was created with (its connection pool
+            size). Defaults to that value.
+
+        Returns:
+            Dict[str, Any]: The content of each file keyed by its filename,
+            or None for files that could not be fetched.
+        """
+        with ThreadPoolExecutor(self._bulk_workers(max_workers)) as executor:
+            contents = executor.map(
+                lambda filename: self._get_target_file_content(
+                    filename, return_format=return_format
+                ),
+                filenames,
+            )
+            return dict(zip(filenames, contents))
+
+    def bulk_put(self, items: Dict[str, str], max_workers: int or None = None):
+        """Create or update several files in your vault concurrently.
+
+        Args:
+            items (Dict[str, str]): The content to write keyed by the path
+            of the target file (relative to your vault root).
+            max_workers (int or None): Number of concurrent requests, capped at
+            the `max_workers` the client was created with (its connection pool
+            size). Defaults to that value.
+        """
+        with ThreadPoolExecutor(self._bulk_workers(max_workers)) as executor:
+            # Consume the iterator so every request has finished on return
+            list(
+                executor.map(self._create_or_update_file, items.keys(), items.values())
+            )
+
+    def get_dir_contents(self, target_dir: str) -> Dict[str, str]:
+        """Return the content of every note under a directory of your vault.
+
+        A single JsonLogic search returns the path and content of all matching
+        notes at once, instead of listing the directory and then fetching each
+        file. Falls back to listing and fetching the files concurrently if the
+        server rejects the query.
+
+        Args:
+            target_dir (str): Path of the directory (relative to your vault root).
+            Notes in its subdirectories are included as well.
+
+        Returns:
+            Dict[str, str]: The markdown content of each note keyed by its path.
+        """
+        target_dir = target_dir.strip("/")
+        pattern = f"{target_dir}/**" if target_dir else "**"
+        # Wrapping the content in a list keeps empty notes in the results,
+        # as an empty string on its own is falsy and would be filtered out.
+        results = self._search_with_query(
+            {
+                "if": [
+                    {"glob": [pattern, {"var": "path"}]},
+                    [{"var": "content"}],
+                    False,
+                ]
+            }
+        )
+        if results is not None:
+            return {match["filename"]: match["result"][0] for match in results}
+
+        logger.info(f"Search was rejected, fetching the files in {target_dir} instead.")
+        return self.bulk_get(self._list_files_recursively(target_dir))
+
+    def _list_files_recursively(self, target_dir: str) -> List[str]:
+        """Lists the paths of all files under the target directory of your vault."""
+        prefix = f"{target_dir}/" if target_dir else ""
+        listing = self._list_files_in_vault(prefix)
+        if listing is None:
+            return []
+
+        filenames = []
+        for name in listing["files"]:
+            if name.endswith("/"):
+                subdir = prefix + name.rstrip("/")
+                filenames.extend(self._list_files_recursively(subdir))
+            else:
+                filenames.append(prefix + name)
+        return filenames
+
+
+class AsyncObsidianFiles:
+    """Asynchronous counterpart of `ObsidianFiles` built on `httpx.AsyncClient`.
+
+    Every request goes through a single keep-alive connection pool, so many
+    independent calls can be overlapped on one event loop, e.g.:
+
+        async with AsyncObsidianFiles(API_URL, API_Key) as Obsidian:
+            contents = await asyncio.gather(
+                *[Obsidian._get_target_file_content(f) for f in filenames]
+            )
+
+    Requires the optional `httpx` package.
+    """
+
+    # Endpoint prefixes, resolved against the client's base_url
+    _VAULT_PREFIX = "/vault/"
+    _COMMANDS_PREFIX = "/commands/"
+    _OPEN_PREFIX = "/open/"
+
+    def __init__(
+        self,
+        api_url: str,
+        token: str,
+        public_cert: str or None = None,
+        public_key: str or None = None,
+        max_connections: int = 32,
+        timeout: float = 10.0,
+    ):
+        if httpx is None:
+            raise ImportError("AsyncObsidianFiles requires the httpx package.")
+
+        # Leave the application's own logging setup alone
+        if not _logging_configured and not logging.root.handlers:
+            configure_logging()
+
+        self.api_url = api_url
+        self.token = token
+        self.headers = {
+            "accept": "text/markdown",
+            "Authorization": f"Bearer {self.token}",
+        }
+
+        self.cert = (public_cert, public_key) if public_cert and public_key else None
+        if self.cert is None:
+            _disable_insecure_warnings()
+
+        self._client = httpx.AsyncClient(
+            base_url=api_url,
+            headers=self.headers,
+            verify=_httpx_verify(self.cert),
+            limits=httpx.Limits(
+                max_keepalive_connections=max_connections // 2,
+                max_connections=max_connections,
+            ),
+            # Bounds every request so a stuck socket cannot hold a pool slot forever
+            timeout=timeout,
+        )
+
+    async def aclose(self):
+        """Close the underlying client and release its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _send_request(
+        self,
+        method: str,
+        cmd: str,
+        data: str or None = None,
+        headers: Dict[str, str] or None = None,
+        params: Dict[str, Any] or None = None,
+    ) -> "httpx.Response":
+        """Send an HTTP request to your local Obsidian server.
+
+        See `ObsidianFiles._send_request` for a description of the arguments.
+        """
+        return await self._client.request(
+            method, cmd, content=data, headers=headers, params=params
+        )
+
+    ### For Active files request! ###
+    async def _get_active_file_content(self) -> str:
+        """Returns the content of the currently active (open) file in Obsidian
+        in markdown format.
+
+        """
+        try:
+            resp = await self._send_request("GET", cmd="/active/")
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Success!")
+            return resp.text  # in text/markdown format
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _append_content_to_active_file(self, content: str):
+        """Appends content to the end of the currently-open note."""
+        try:
+            resp = await self._send_request(
+                "POST", cmd="/active/", data=content, headers={"accept": "*/*"}
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Added content successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _update_content_of_active_file(self, content: str):
+        """Update content of the currently-open note."""
+        try:
+            resp = await self._send_request("POST", cmd="/active/", data=content)
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Updated content successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _delete_active_file(self):
+        """Delete the currently active file in Obsidian"""
+        try:
+            resp = await self._send_request("DELETE", cmd="/active/")
+            resp.raise_for_status()
+            if resp.status_code == 204:
+                logger.info("Deleted the currently active file in Obsidian.")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _insert_content_of_active_file(
+        self,
+        content: str,
+        heading: str,
+        insert_position: str,
+        heading_boundary: str = "",
+    ):
+        """Insert content into the currently-open note
+        relative to a heading within that note.
+
+        See `ObsidianFiles._insert_content_of_active_file` for the arguments.
+        """
+        # set the header parameters
+        headers = {
+            "accept": "*/*",
+            "Heading": heading,
+            "Content-Insertion-Position": insert_position,
+            "Content-Type": "text/markdown",
+        }
+        if heading_boundary != "":
+            headers["Heading-Boundary"] = heading_boundary
+
+        try:
+            resp = await self._send_request(
+                "PATCH", cmd="/active/", data=content, headers=headers
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Inserted the content successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    ### Target files in your vault ###
+    async def _get_target_file_content(
+        self,
+        target_filename: str,
+        return_format: str = "text/markdown",
+    ) -> Dict[str, Any]:
+        """
+        Return the content of the file at the specified path
+        in your vault should the file exist.
+
+        See `ObsidianFiles._get_target_file_content` for the arguments.
+        """
+        accept = (
+            "application/vnd.olrapi.note+json"
+            if return_format == "json"
+            else "text/markdown"
+        )
+        try:
+            resp = await self._send_request(
+                "GET",
+                cmd=self._VAULT_PREFIX + _quote_path(target_filename),
+                headers={"accept": accept},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Got the content of {target_filename} successfully!")
+                return (
+                    resp.text
+                    if return_format == "text/markdown"
+                    else _json_loads(resp.content)
+                )
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _create_or_update_file(self, target_filename: str, content: str):
+        """Create a new file in your vault or
+        update the content of an existing one if the specified file already exists.
+        """
+        try:
+            resp = await self._send_request(
+                "PUT",
+                cmd=self._VAULT_PREFIX + _quote_path(target_filename),
+                data=content,
+                headers={"accept": "*/*"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Updated {target_filename} successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _append_content_to_target_file(self, target_filename: str, content: str):
+        """
+        Appends content to the end of the target note.
+        If the specified file does not yet exist, it will be created as an empty file.
+        """
+        try:
+            resp = await self._send_request(
+                "PUT",
+                cmd=self._VAULT_PREFIX + _quote_path(target_filename),
+                data=content,
+                headers={"accept": "*/*"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Updated {target_filename} successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _insert_content_of_target_file(
+        self,
+        target_filename: str,
+        content: str,
+        heading: str,
+        insert_position: str,
+        heading_boundary: str = "",
+    ):
+        """Inserts content into a target note
+        relative to a heading within that note.
+
+        See `ObsidianFiles._insert_content_of_target_file` for the arguments.
+        """
+        # set the header parameters
+        headers = {
+            "accept": "*/*",
+            "Heading": heading,
+            "Content-Insertion-Position": insert_position,
+            "Content-Type": "text/markdown",
+        }
+        if heading_boundary != "":
+            headers["Heading-Boundary"] = heading_boundary
+
+        try:
+            resp = await self._send_request(
+                "PATCH",
+                cmd=self._VAULT_PREFIX + _quote_path(target_filename),
+                data=content,
+                headers=headers,
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Inserted content to {target_filename} successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _delete_target_file(self, target_filename: str):
+        """Delete target file from the vault."""
+        try:
+            resp = await self._send_request(
+                "DELETE",
+                cmd=self._VAULT_PREFIX + _quote_path(target_filename),
+                headers={"accept": "*/*"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Deleted {target_filename} successfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    ### Value Directoryies ###
+    async def _list_files_in_vault(self, target_dir: str) -> Dict[str, any]:
+        """Lists files in the target directory of your vault."""
+        try:
+            resp = await self._send_request(
+                "GET",
+                cmd=self._VAULT_PREFIX + _quote_path(target_dir),
+                headers={"accept": "application/json"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info(f"Got the list of files in {target_dir} successfully!")
+                return _json_loads(resp.content)
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    ### Commands ###
+    async def _list_commands(self) -> Dict[str, any]:
+        """Lists all available commands in Obsidian."""
+        try:
+            resp = await self._send_request(
+                "GET",
+                cmd="/commands/",
+                headers={"accept": "application/json"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Fetched all the commands successfully!")
+                return _json_loads(resp.content)
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _run_command(self, command_id: str):
+        """Executes a command in Obsidian."""
+        try:
+            resp = await self._send_request(
+                "POST",
+                cmd=self._COMMANDS_PREFIX + _quote_path(command_id),
+                headers={"accept": "*/*"},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("The command is executed sucessfully!")
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    ### Search ###
+    async def _search_with_query(
+        self, request_body: str or dict
+    ) -> List[dict[str, any]]:
+        """Search for documents matching a Dataview DQL or JsonLogic query.
+
+        See `ObsidianFiles._search_with_query` for details.
+        """
+        try:
+            headers = {
+                "accept": "application/json",
+                "Content-Type": (
+                    "application/vnd.olrapi.dataview.dql+txt"
+                    if isinstance(request_body, str)
+                    else "application/vnd.olrapi.jsonlogic+json"
+                ),
+            }
+
+            req_body = (
+                request_body
+                if isinstance(request_body, str)
+                else _json_dumps(request_body)
+            )
+
+            resp = await self._send_request(
+                "POST", cmd="/search/", data=req_body, headers=headers
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Got the results!")
+                return _json_loads(resp.content)
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _search_with_simple_query(
+        self, query: str, content_length: int = 100
+    ) -> List[dict[str, any]]:
+        """Search for documents matching a specificed search text query."""
+        try:
+            resp = await self._send_request(
+                "POST",
+                cmd="/search/simple/",
+                headers={"accept": "application/json"},
+                params={"query": query, "contextLength": content_length},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Got the results!")
+                return resp.json()
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    async def _search_with_gui(
+        self, query: str, content_length: int = 100
+    ) -> List[dict[str, any]]:
+        """Uses the search built into the Obsidian UI to find matching files."""
+        try:
+            resp = await self._send_request(
+                "POST",
+                cmd="/search/gui/",
+                headers={"accept": "application/json"},
+                params={"query": query, "contextLength": content_length},
+            )
+            resp.raise_for_status()
+            if resp.status_code == 200:
+                logger.info("Got the results!")
+                return resp.json()
+        except httpx.HTTPStatusError as err:
+            logging.error(err)
+            return None
+
+    ### Open ###
+    async def _open_file(self, target_filename: str, new_leaf: bool = False):
+        """Opens the specified document in Obsidian."""
+        try:
+            resp = await self._send_request(
+                "POST",
+                cmd=self._OPEN_PREFIX + _quote_path(target_filename),
+                headers={"accept": "application/json"},
+                params={"newLeaf": "true" if new_leaf else "false"},
             )
             resp.raise_for_status()
             if resp.status_code == 200:
                 logger.info(f"Opened {target_filename} in Obsidian.")
-        except HTTPError as err:
+        except httpx.HTTPStatusError as err:
             logging.error(err)
             return None
@@ -0,0 +1,413 @@
+import asyncio
+import io
+import json
+from unittest import mock
+
+import httpx
+import pytest
+from requests import Response
+from requests.exceptions import HTTPError
+
+import python_obsidian_api
+from python_obsidian_api import AsyncObsidianFiles, ObsidianFiles
+
+API_URL = "https://127.0.0.1:27124"
+
+
+def make_response(status_code=200, body=b"", headers=None):
+    resp = Response()
+    resp.status_code = status_code
+    resp._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    resp.headers.update(headers or {})
+    resp.encoding = "utf-8"
+    resp.url = API_URL
+    return resp
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Keep the tests from writing log files next to the module
+    monkeypatch.setattr(python_obsidian_api, "_logging_configured", True)
+    client = ObsidianFiles(API_URL, "token", dedupe_window_seconds=2)
+    client._session.request = mock.Mock()
+    yield client
+    client.close()
+
+
+def sent_requests(client):
+    return [call.args for call in client._session.request.call_args_list]
+
+
+### Search ###
+def test_search_many_sends_a_single_query(client):
+    client._session.request.return_value = make_response(body=[])
+
+    client.search_many(["daily/*.md", {"in": ["todo", {"var": "content"}]}])
+
+    assert len(sent_requests(client)) == 1
+    body = json.loads(client._session.request.call_args.kwargs["data"])
+    logic = [
+        {"glob": ["daily/*.md", {"var": "path"}]},
+        {"in": ["todo", {"var": "content"}]},
+    ]
+    assert body == {"if": [{"or": logic}, logic, False]}
+
+
+def test_search_many_groups_results_per_query(client):
+    client._session.request.return_value = make_response(
+        body=[
+            {"filename": "daily/a.md", "result": [True, False, True]},
+            {"filename": "daily/b.md", "result": [True, True, True]},
+            {"filename": "notes/c.md", "result": [False, True, False]},
+        ]
+    )
+    content_query = {"in": ["todo", {"var": "content"}]}
+
+    matches = client.search_many(["daily/*.md", content_query, "daily/*.md"])
+
+    assert matches == {
+        "daily/*.md": ["daily/a.md", "daily/b.md"],
+        json.dumps(content_query): ["daily/b.md", "notes/c.md"],
+    }
+
+
+def test_search_many_returns_none_when_the_search_fails(client):
+    client._session.request.return_value = make_response(400)
+
+    assert client.search_many(["*.md"]) is None
+
+
+### Caching ###
+def test_unchanged_file_is_revalidated_and_served_from_cache(client):
+    client._session.request.side_effect = [
+        make_response(body=b"# Note", headers={"ETag": '"v1"'}),
+        make_response(304),
+    ]
+
+    assert client._get_target_file_content("note.md") == "# Note"
+    assert client._get_target_file_content("note.md") == "# Note"
+
+    headers = client._session.request.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+
+
+def test_cached_listing_is_a_fresh_copy(client):
+    client._session.request.side_effect = [
+        make_response(body={"files": ["a.md"]}, headers={"ETag": '"v1"'}),
+        make_response(304),
+    ]
+
+    client._list_files_in_vault("")["files"].append("b.md")
+
+    assert client._list_files_in_vault("") == {"files": ["a.md"]}
+
+
+def test_unexpected_not_modified_without_cache_entry(client):
+    client._session.request.return_value = make_response(304)
+
+    assert client._list_files_in_vault("") is None
+    assert client._get_target_file_content("note.md") is None
+    assert client._get_target_file_content("note.md", return_format="json") is None
+
+
+def test_writing_a_file_invalidates_its_cache_entry(client):
+    client._session.request.side_effect = [
+        make_response(body=b"# Note", headers={"ETag": '"v1"'}),
+        make_response(204),
+        make_response(body=b"# New", headers={"ETag": '"v2"'}),
+    ]
+
+    client._get_target_file_content("note.md")
+    client._create_or_update_file("note.md", "# New")
+
+    assert client._get_target_file_content("note.md") == "# New"
+    headers = client._session.request.call_args.kwargs["headers"]
+    assert "If-None-Match" not in headers
+
+
+def test_cache_is_bounded(client, monkeypatch):
+    monkeypatch.setattr(ObsidianFiles, "_CACHE_SIZE", 2)
+    client._session.request.side_effect = lambda *args, **kwargs: make_response(
+        body=b"content", headers={"ETag": '"v1"'}
+    )
+
+    for filename in ("a.md", "b.md", "c.md"):
+        client._get_target_file_content(filename)
+
+    assert [key[0] for key in client._cache] == [
+        f"{API_URL}/vault/b.md",
+        f"{API_URL}/vault/c.md",
+    ]
+
+
+def test_writing_a_file_invalidates_listings_without_trailing_slash(client):
+    client._session.request.side_effect = [
+        make_response(body={"files": ["a.md"]}, headers={"ETag": '"v1"'}),
+        make_response(204),
+    ]
+
+    client._list_files_in_vault("notes")
+    client._create_or_update_file("notes/b.md", "# B")
+
+    assert not client._cache
+
+
+
+
+### Appends ###
+def test_duplicate_append_within_window_is_skipped(client):
+    client._session.request.return_value = make_response(204)
+
+    client._append_content_to_target_file("journal.md", "entry")
+    client._append_content_to_target_file("journal.md", "entry")
+    client._append_content_to_target_file("other.md", "entry")
+
+    assert len(sent_requests(client)) == 2
+
+
+def test_duplicate_append_after_window_is_sent(client):
+    client._session.request.return_value = make_response(204)
+
+    with mock.patch.object(python_obsidian_api.time, "monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        client._append_content_to_target_file("journal.md", "entry")
+        monotonic.return_value = 103.0
+        client._append_content_to_target_file("journal.md", "entry")
+
+    assert len(sent_requests(client)) == 2
+
+
+def test_failed_append_is_not_remembered(client):
+    client._session.request.side_effect = [make_response(500), make_response(204)]
+
+    client._append_content_to_target_file("journal.md", "entry")
+    client._append_content_to_target_file("journal.md", "entry")
+
+    assert len(sent_requests(client)) == 2
+
+
+def test_active_file_appends_are_never_skipped(client):
+    client._session.request.return_value = make_response(204)
+
+    client._append_content_to_active_file("entry")
+    client._append_content_to_active_file("entry")
+
+    assert len(sent_requests(client)) == 2
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda client: client._create_or_update_file("journal.md", "other"),
+        lambda client: client._insert_content_of_target_file(
+            "journal.md", "other", "Heading", "end"
+        ),
+        lambda client: client._delete_target_file("journal.md"),
+    ],
+)
+def test_other_writes_reset_the_dedupe_window(client, write):
+    client._session.request.return_value = make_response(204)
+
+    client._append_content_to_target_file("journal.md", "entry")
+    write(client)
+    client._append_content_to_target_file("journal.md", "entry")
+
+    assert [args[0] for args in sent_requests(client)][-1] == "PUT"
+    assert len(sent_requests(client)) == 3
+
+
+### Directories ###
+def test_get_dir_contents_uses_a_single_search(client):
+    client._session.request.return_value = make_response(
+        body=[
+            {"filename": "notes/a.md", "result": ["# A"]},
+            {"filename": "notes/empty.md", "result": [""]},
+        ]
+    )
+
+    assert client.get_dir_contents("notes/") == {
+        "notes/a.md": "# A",
+        "notes/empty.md": "",
+    }
+    assert len(sent_requests(client)) == 1
+
+
+def test_get_dir_contents_falls_back_to_listing_and_fetching(client):
+    responses = {
+        ("POST", f"{API_URL}/search/"): make_response(400),
+        ("GET", f"{API_URL}/vault/notes/"): make_response(
+            body={"files": ["a.md", "sub/"]}
+        ),
+        ("GET", f"{API_URL}/vault/notes/sub/"): make_response(
+            body={"files": ["b.md"]}
+        ),
+        ("GET", f"{API_URL}/vault/notes/a.md"): make_response(body=b"# A"),
+        ("GET", f"{API_URL}/vault/notes/sub/b.md"): make_response(body=b"# B"),
+    }
+    client._session.request.side_effect = lambda method, url, **kwargs: responses[
+        (method, url)
+    ]
+
+    assert client.get_dir_contents("notes") == {
+        "notes/a.md": "# A",
+        "notes/sub/b.md": "# B",
+    }
+
+
+### Streaming ###
+def make_stream_response(status_code=200, body=b""):
+    resp = Response()
+    resp.status_code = status_code
+    resp.raw = io.BytesIO(body)
+    resp.url = API_URL
+    return resp
+
+
+def test_stream_yields_the_raw_body_then_closes_the_response(client):
+    resp = make_stream_response(body=b"# Large note")
+    resp.close = mock.Mock(wraps=resp.close)
+    client._session.request.return_value = resp
+
+    chunks = client._get_target_file_content_stream("note.md", chunk_size=4)
+
+    resp.close.assert_not_called()
+    assert b"".join(chunks) == b"# Large note"
+    resp.close.assert_called_once()
+    assert client._session.request.call_args.kwargs["stream"] is True
+
+
+def test_stream_raises_on_error_status_before_iterating(client):
+    resp = make_stream_response(404)
+    client._session.request.return_value = resp
+
+    with pytest.raises(HTTPError):
+        client._get_target_file_content_stream("missing.md")
+    assert resp.raw.closed
+
+
+### HTTP/2 transport ###
+def make_httpx2_client(monkeypatch, handler):
+    pytest.importorskip("h2")
+    monkeypatch.setattr(python_obsidian_api, "_logging_configured", True)
+    client = ObsidianFiles(API_URL, "token", transport="httpx2")
+    client._session.close()
+    client._session = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=client.headers
+    )
+    return client
+
+
+def test_httpx2_requires_h2(monkeypatch):
+    monkeypatch.setattr(python_obsidian_api.importlib.util, "find_spec", lambda _: None)
+
+    with pytest.raises(ImportError, match=r"httpx\[http2\]"):
+        ObsidianFiles(API_URL, "token", transport="httpx2")
+
+
+def test_httpx2_unchanged_file_is_served_from_cache(monkeypatch):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="# Note", headers={"ETag": '"v1"'})
+
+    client = make_httpx2_client(monkeypatch, handler)
+
+    assert client._get_target_file_content("note.md") == "# Note"
+    assert client._get_target_file_content("note.md") == "# Note"
+
+
+def test_httpx2_error_status_returns_none(monkeypatch):
+    client = make_httpx2_client(monkeypatch, lambda request: httpx.Response(404))
+
+    assert client._get_target_file_content("missing.md") is None
+
+
+def test_httpx2_stream(monkeypatch):
+    def handler(request):
+        if request.url.path == "/vault/missing.md":
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"# Large note")
+
+    client = make_httpx2_client(monkeypatch, handler)
+
+    chunks = client._get_target_file_content_stream("note.md", chunk_size=4)
+    assert b"".join(chunks) == b"# Large note"
+    with pytest.raises(httpx.HTTPStatusError):
+        client._get_target_file_content_stream("missing.md")
+
+
+### Async client ###
+def run_async_client(monkeypatch, handler, call):
+    monkeypatch.setattr(python_obsidian_api, "_logging_configured", True)
+
+    async def run():
+        client = AsyncObsidianFiles(API_URL, "token")
+        await client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url=API_URL,
+            headers=client.headers,
+            transport=httpx.MockTransport(handler),
+        )
+        async with client:
+            return await call(client)
+
+    return asyncio.run(run())
+
+
+def test_async_client_bounds_requests_with_a_timeout(monkeypatch):
+    monkeypatch.setattr(python_obsidian_api, "_logging_configured", True)
+    client = AsyncObsidianFiles(API_URL, "token", timeout=3)
+
+    assert client._client.timeout == httpx.Timeout(3)
+    asyncio.run(client.aclose())
+
+
+def test_async_client_encodes_paths_and_sends_headers(monkeypatch):
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(200, json={"path": "my notes/a#1.md"})
+
+    note = run_async_client(
+        monkeypatch,
+        handler,
+        lambda client: client._get_target_file_content(
+            "my notes/a#1.md", return_format="json"
+        ),
+    )
+
+    assert note == {"path": "my notes/a#1.md"}
+    request = requests_sent[0]
+    assert request.url.raw_path == b"/vault/my%20notes/a%231.md"
+    assert request.headers["accept"] == "application/vnd.olrapi.note+json"
+    assert request.headers["Authorization"] == "Bearer token"
+
+
+def test_async_client_sends_query_params(monkeypatch):
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(200, json=[])
+
+    run_async_client(
+        monkeypatch,
+        handler,
+        lambda client: client._search_with_simple_query("a & b", content_length=50),
+    )
+
+    request = requests_sent[0]
+    assert request.url.path == "/search/simple/"
+    assert request.url.params["query"] == "a & b"
+    assert request.url.params["contextLength"] == "50"
+
+
+def test_async_client_error_status_returns_none(monkeypatch):
+    content = run_async_client(
+        monkeypatch,
+        lambda request: httpx.Response(404),
+        lambda client: client._get_target_file_content("missing.md"),
+    )
+
+    assert content is None